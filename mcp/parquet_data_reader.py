@@ -9,12 +9,15 @@ serving structured power curve and forecasting data.
 
 import logging
 import pandas as pd
+import pyarrow.parquet as pq
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Union
 import json
 
 logger = logging.getLogger(__name__)
 
+PROCESSED_DIR = Path(__file__).parent.parent / "data" / "processed"
+
 class ParquetDataReader:
     """
     Unified data access layer for pre-processed wind farm analysis results.
@@ -23,7 +26,7 @@ class ParquetDataReader:
     access to power curve parameters, forecast metrics, and analysis results.
     """
     
-    def __init__(self, data_dir: str = "/workspaces/temus/data/processed"):
+    def __init__(self, data_dir: str = str(PROCESSED_DIR)):
         """
         Initialize the data reader with the processed data directory.
         
@@ -269,7 +272,7 @@ class ParquetDataReader:
             if wind_farm and 'wind_farm' in df.columns:
                 # Normalize wind farm ID
                 wind_farm_normalized = self._normalize_wind_farm_id(wind_farm)
-                df_filtered = df[df['wind_farm'].str.contains(wind_farm_normalized, case=False, na=False)]
+                df_filtered = df[df['wind_farm'].str.lower() == wind_farm_normalized]
             else:
                 df_filtered = df
             
@@ -300,7 +303,7 @@ class ParquetDataReader:
             
             if wind_farm and 'wind_farm' in df.columns:
                 wind_farm_normalized = self._normalize_wind_farm_id(wind_farm)
-                df_filtered = df[df['wind_farm'].str.contains(wind_farm_normalized, case=False, na=False)]
+                df_filtered = df[df['wind_farm'].str.lower() == wind_farm_normalized]
             else:
                 df_filtered = df
             
@@ -325,7 +328,7 @@ class ParquetDataReader:
             
             if wind_farm and 'wind_farm' in df.columns:
                 wind_farm_normalized = self._normalize_wind_farm_id(wind_farm)
-                df_filtered = df[df['wind_farm'].str.contains(wind_farm_normalized, case=False, na=False)]
+                df_filtered = df[df['wind_farm'].str.lower() == wind_farm_normalized]
             else:
                 df_filtered = df
             
@@ -628,11 +631,20 @@ class ParquetDataReader:
                 if file_path.exists():
                     try:
                         file_info['size_mb'] = round(file_path.stat().st_size / (1024 * 1024), 2)
-                        df = self._load_file(filename)
-                        if df is not None:
-                            file_info['shape'] = df.shape
-                            file_info['columns'] = list(df.columns)
-                            summary['total_files'] += 1
+                        # Footer metadata only - no need to decode the column data
+                        parquet_file = pq.ParquetFile(file_path)
+                        pandas_meta = parquet_file.schema_arrow.pandas_metadata or {}
+                        index_columns = {
+                            col for col in pandas_meta.get('index_columns', [])
+                            if isinstance(col, str)
+                        }
+                        columns = [
+                            name for name in parquet_file.schema_arrow.names
+                            if name not in index_columns
+                        ]
+                        file_info['shape'] = (parquet_file.metadata.num_rows, len(columns))
+                        file_info['columns'] = columns
+                        summary['total_files'] += 1
                     except Exception as e:
                         file_info['error'] = str(e)
                 
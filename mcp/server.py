@@ -7,18 +7,32 @@ the Model Context Protocol (MCP). It uses a prompt-guided approach to analyze
 existing Jupyter notebooks without modifying their code.
 """
 
+import copy
 import json
 import logging
+import mmap
+import os
 import re
 import sys
+import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 from pathlib import Path
 from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime
 from fastmcp import FastMCP
 
+# Prefer orjson for parsing JSON config when it is installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
 # Setup logging to stderr only (MCP protocol needs clean stdout)
-import sys
 logging.basicConfig(
     level=logging.WARNING,  # Reduce log level to WARNING to minimize output
     stream=sys.stderr,      # Ensure logs go to stderr, not stdout
@@ -29,10 +43,68 @@ logger = logging.getLogger("windpower-mcp")
 # Initialize FastMCP server
 mcp = FastMCP("Wind Farm Analytics with Smart Routing")
 
+CONFIG_PATH = Path(__file__).parent / "notebook_config.json"
+PROCESSED_DIR = Path(__file__).parent.parent / "data" / "processed"
+
+# Parsed notebook configuration as (mtime_ns, config)
+_config_cache: Optional[tuple] = None
+
+# JSON files at least this large are parsed from a memory map
+_MMAP_MIN_BYTES = 1 << 20
+
+def _read_json_file(path: Path, size: int) -> Any:
+    """Parse a JSON file, mapping large files into memory instead of copying them."""
+    if orjson is not None and size >= _MMAP_MIN_BYTES:
+        try:
+            with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+        except OSError as e:
+            logger.debug("Could not memory-map %s, reading instead: %s", path, e)
+    
+    return _json_loads(path.read_bytes())
+
+def _load_notebook_config() -> Optional[Dict[str, Any]]:
+    """Load notebook_config.json, reusing the parsed copy until the file changes."""
+    global _config_cache
+    
+    try:
+        stat = CONFIG_PATH.stat()
+    except FileNotFoundError:
+        return None
+    
+    if _config_cache is None or _config_cache[0] != stat.st_mtime_ns:
+        _config_cache = (stat.st_mtime_ns, _read_json_file(CONFIG_PATH, stat.st_size))
+    
+    return _config_cache[1]
+
+def _is_numeric_column(arr_or_dtype) -> bool:
+    """True for numeric columns, excluding bool flags such as data_quality_checked."""
+    return (pd.api.types.is_numeric_dtype(arr_or_dtype)
+            and not pd.api.types.is_bool_dtype(arr_or_dtype))
+
+@lru_cache(maxsize=128)
+def _normalize_farm_id(wind_farm: str) -> str:
+    """Normalize a non-empty wind farm ID (wf1, wp1, 1, 'wind farm 1') to wp format."""
+    farm_id = wind_farm.lower().strip()
+    
+    # Convert various formats to wp format for consistency
+    if farm_id.startswith('wf'):
+        return 'wp' + farm_id[2:]
+    elif farm_id.startswith('wind farm '):
+        num = farm_id.replace('wind farm ', '')
+        return f'wp{num}'
+    elif farm_id.isdigit():
+        return f'wp{farm_id}'
+    elif not farm_id.startswith('wp'):
+        return f'wp{farm_id}'
+    
+    return farm_id
+
 class DataAccess:
     """Integrated parquet data access functionality with model performance tracking."""
     
-    def __init__(self, data_dir: str = "/workspaces/temus/data/processed"):
+    def __init__(self, data_dir: str = str(PROCESSED_DIR)):
         self.data_dir = Path(data_dir)
         self._cache = {}  # Simple cache for repeated queries
         
@@ -90,12 +162,8 @@ class DataAccess:
     
     def _load_config(self) -> Dict[str, Any]:
         """Load notebook completion configuration"""
-        config_path = Path(__file__).parent / "notebook_config.json"
-        if config_path.exists():
-            with open(config_path, 'r') as f:
-                return json.load(f)
-        else:
-            return {}
+        config = _load_notebook_config()
+        return config if config is not None else {}
     
     def get_model_performance(self, model_type: str = "all", metric: str = "rmse", horizon: int = None) -> Dict[str, Any]:
         """Get model performance with availability checking and fallbacks"""
@@ -196,12 +264,12 @@ class DataAccess:
                 horizon_columns = [col for col in metric_columns if str(horizon) in col or f"{horizon}h" in col]
                 if horizon_columns:
                     for col in horizon_columns:
-                        if df[col].dtype in ['float64', 'int64']:
+                        if _is_numeric_column(df[col]):
                             metrics[f"{metric}_{horizon}h"] = float(df[col].iloc[0]) if len(df) > 0 else None
             else:
                 # Get general metrics
                 for col in metric_columns:
-                    if df[col].dtype in ['float64', 'int64']:
+                    if _is_numeric_column(df[col]):
                         metrics[col] = float(df[col].iloc[0]) if len(df) > 0 else None
                         
         except Exception as e:
@@ -213,21 +281,8 @@ class DataAccess:
         """Normalize wind farm ID to consistent format."""
         if not wind_farm:
             return None
-            
-        farm_id = wind_farm.lower().strip()
-        
-        # Convert various formats to wp format for consistency
-        if farm_id.startswith('wf'):
-            return farm_id.replace('wf', 'wp')
-        elif farm_id.startswith('wind farm '):
-            num = farm_id.replace('wind farm ', '')
-            return f'wp{num}'
-        elif farm_id.isdigit():
-            return f'wp{farm_id}'
-        elif not farm_id.startswith('wp'):
-            return f'wp{farm_id}'
         
-        return farm_id
+        return _normalize_farm_id(wind_farm)
     
     def get_wind_farm_data(self, wind_farm: str = None, data_type: str = "power_curve") -> Dict[str, Any]:
         """Unified data access method with caching."""
@@ -235,7 +290,7 @@ class DataAccess:
         
         # Check cache first
         if cache_key in self._cache:
-            logger.info(f"Returning cached data for {cache_key}")
+            logger.info("Returning cached data for %s", cache_key)
             return self._cache[cache_key]
         
         # Route to appropriate method
@@ -472,7 +527,7 @@ class DataAccess:
         for col in df.columns:
             col_lower = col.lower()
             
-            if df[col].dtype in ['float64', 'int64'] and not df[col].isna().all():
+            if _is_numeric_column(df[col]) and df[col].notna().any():
                 if 'capacity' in col_lower and 'factor' in col_lower:
                     extracted['capacity_factors'][f'average_{col}'] = float(df[col].mean())
                 elif any(keyword in col_lower for keyword in ['cut_in', 'rated_speed', 'rated_power']):
@@ -491,7 +546,7 @@ class DataAccess:
             for col in df.columns:
                 col_lower = col.lower()
                 if any(keyword in col_lower for keyword in quality_keywords):
-                    if df[col].dtype in ['float64', 'int64']:
+                    if _is_numeric_column(df[col]):
                         quality_metrics[col] = float(df[col].mean())
                     elif df[col].dtype == 'object':
                         quality_metrics[col] = df[col].value_counts().to_dict()
@@ -569,10 +624,9 @@ class QueryRouter:
     
     def _load_config(self) -> Dict[str, Any]:
         """Load notebook completion configuration"""
-        config_path = Path(__file__).parent / "notebook_config.json"
-        if config_path.exists():
-            with open(config_path, 'r') as f:
-                return json.load(f)
+        config = _load_notebook_config()
+        if config is not None:
+            return config
         else:
             # Fallback to basic config
             logger.warning("Config file not found, using fallback configuration")
@@ -822,7 +876,7 @@ def _analyze_pattern_internal(
     Returns:
         Dictionary containing analysis guidance and search recommendations
     """
-    logger.info(f"Pattern analysis request: {query}")
+    logger.info("Pattern analysis request: %s", query)
     
     try:
         # Automatically classify the query if pattern_type is general
@@ -1049,7 +1103,7 @@ def get_wind_farm_data(
     Example:
         >>> get_wind_farm_data("wf3", "power_curve", True)
     """
-    logger.info(f"Getting wind farm data: {wind_farm}, type: {data_type}")
+    logger.info("Getting wind farm data: %s, type: %s", wind_farm, data_type)
     
     try:
         # Use integrated data access
@@ -1113,7 +1167,7 @@ def analyze_power_curves(
     Example:
         >>> analyze_power_curves("wf3", ["capacity_factor", "rated_speed"])
     """
-    logger.info(f"Analyzing power curves for wind farm: {wind_farm}")
+    logger.info("Analyzing power curves for wind farm: %s", wind_farm)
     
     try:
         # Use integrated data access for power curve data
@@ -1543,13 +1597,7 @@ def diagnose_forecast_errors(
         query_parts.append(f"focusing on {error_type}")
     
     if wind_farm:
-        farm_id = wind_farm.lower().strip()
-        if not farm_id.startswith('wp') and not farm_id.startswith('wf'):
-            farm_id = f'wp{farm_id}'
-        elif farm_id.startswith('wf'):
-            # Convert wf to wp format
-            farm_id = farm_id.replace('wf', 'wp')
-        query_parts.append(f"for {farm_id}")
+        query_parts.append(f"for {_normalize_farm_id(wind_farm)}")
     
     if time_period:
         query_parts.append(f"during {time_period} periods")
@@ -1558,6 +1606,13 @@ def diagnose_forecast_errors(
     return _analyze_pattern_internal(" ".join(query_parts), pattern_type="error_analysis")
 
 # Legacy tools for backward compatibility
+@lru_cache(maxsize=64)
+def _build_farm_summary(farm_id: str) -> Dict[str, Any]:
+    """Build the summarize_wind_farm response; it only depends on the farm ID and startup config."""
+    # Route to pattern analysis with specific query
+    query = f"What are the statistics and capacity factor for wind farm {farm_id}?"
+    return _analyze_pattern_internal(query, "power_curve")
+
 @mcp.tool()
 def summarize_wind_farm(farm_id: str = "wf1") -> Dict[str, Any]:
     """
@@ -1569,9 +1624,12 @@ def summarize_wind_farm(farm_id: str = "wf1") -> Dict[str, Any]:
     Returns:
         Dictionary containing wind farm statistics
     """
-    # Route to pattern analysis with specific query
-    query = f"What are the statistics and capacity factor for wind farm {farm_id}?"
-    return _analyze_pattern_internal(query, "power_curve")
+    return dict(_build_farm_summary(farm_id))
+
+# The all-farms comparison is the same on every call, so route it once
+_ALL_FARMS_COMPARISON = _analyze_pattern_internal(
+    "Compare capacity factors and performance across all wind farms", "comparison"
+)
 
 @mcp.tool()
 def compare_wind_farms(farm_ids: Optional[str] = None) -> Dict[str, Any]:
@@ -1585,11 +1643,10 @@ def compare_wind_farms(farm_ids: Optional[str] = None) -> Dict[str, Any]:
     Returns:
         Dictionary containing comparative statistics across wind farms
     """
-    if farm_ids:
-        query = f"Compare capacity factors and performance for wind farms {farm_ids}"
-    else:
-        query = "Compare capacity factors and performance across all wind farms"
+    if not farm_ids:
+        return dict(_ALL_FARMS_COMPARISON)
     
+    query = f"Compare capacity factors and performance for wind farms {farm_ids}"
     return _analyze_pattern_internal(query, "comparison")
 
 @mcp.tool()
@@ -1609,6 +1666,19 @@ def search_notebooks(
     """
     return _analyze_pattern_internal(query, analysis_type or "general")
 
+# Prompts are loaded once at startup, so the wind farm listing never changes
+_LIST_FARMS_PAYLOAD = {
+    "wind_farms": ["wp1", "wp2", "wp3", "wp4", "wp5", "wp6", "wp7"],
+    "dataset": "GEF2012 Wind Forecasting Competition",
+    "period": "July 2009 - June 2012",
+    "forecast_horizons": "1-48 hours",
+    "guidance": {
+        "notebooks_to_examine": ["01_data_foundation.ipynb", "02_wind_physics_analysis.ipynb"],
+        "key_metrics": ["capacity_factor", "cut_in_speed", "rated_power", "data_quality"],
+        "analysis_prompt": query_router.prompts.get('power_curve_analysis', '')
+    }
+}
+
 @mcp.tool()
 def list_available_wind_farms() -> Dict[str, Any]:
     """
@@ -1617,17 +1687,7 @@ def list_available_wind_farms() -> Dict[str, Any]:
     Returns:
         Dictionary containing list of wind farm IDs and basic metadata
     """
-    return {
-        "wind_farms": ["wp1", "wp2", "wp3", "wp4", "wp5", "wp6", "wp7"],
-        "dataset": "GEF2012 Wind Forecasting Competition",
-        "period": "July 2009 - June 2012",
-        "forecast_horizons": "1-48 hours",
-        "guidance": {
-            "notebooks_to_examine": ["01_data_foundation.ipynb", "02_wind_physics_analysis.ipynb"],
-            "key_metrics": ["capacity_factor", "cut_in_speed", "rated_power", "data_quality"],
-            "analysis_prompt": query_router.prompts.get('power_curve_analysis', '')
-        }
-    }
+    return copy.deepcopy(_LIST_FARMS_PAYLOAD)
 
 @mcp.tool()
 def extract_notebook_results(
@@ -1659,6 +1719,103 @@ def extract_notebook_results(
     query = f"Extract {result_type} results from {notebook_path}"
     return _analyze_pattern_internal(query, intent)
 
+# Everything except the timestamp is fixed once configuration is loaded
+_SERVER_STATUS_PAYLOAD = {
+    "server_name": "Wind Farm Analytics MCP Server",
+    "version": "2.1.0",
+    "approach": "Integrated Data Access + Smart Query Routing + Graceful Fallbacks",
+    "status": "operational",
+    "architecture": "self_contained_with_status_tracking",
+    "capabilities": [
+        "Automatic query intent detection",
+        "Smart prompt combination", 
+        "Entity extraction",
+        "Multi-intent handling",
+        "Business context integration",
+        "Domain-specific tool APIs",
+        "Integrated parquet data access",
+        "Real-time structured data serving",
+        "Intelligent caching system",
+        "Robust error handling",
+        "Feature availability checking",
+        "Graceful fallback responses",
+        "Status-aware routing",
+        "Alternative recommendation system"
+    ],
+    "development_phases": {
+        "phase_1": {
+            "status": "complete",
+            "notebooks": ["01-08"],
+            "capabilities": ["data_analysis", "individual_models", "basic_forecasting"]
+        },
+        "phase_2": {
+            "status": "pending",
+            "notebooks": ["09-10"],
+            "capabilities": ["ensemble_models", "uncertainty_quantification", "comprehensive_evaluation"]
+        },
+        "phase_3": {
+            "status": "pending", 
+            "notebooks": ["11-12"],
+            "capabilities": ["production_deployment", "business_presentation"]
+        }
+    },
+    "available_tools": [
+        "get_wind_farm_data",
+        "analyze_power_curves",
+        "discover_processed_data",
+        "evaluate_forecast_performance", 
+        "assess_temporal_patterns",
+        "quantify_uncertainty",
+        "calculate_business_impact",
+        "compare_model_architectures",
+        "analyze_feature_importance",
+        "diagnose_forecast_errors",
+        "analyze_pattern",
+        "summarize_wind_farm",
+        "compare_wind_farms",
+        "search_notebooks",
+        "list_available_wind_farms",
+        "extract_notebook_results",
+        "server_status"
+    ],
+    "data_access": {
+        "system": "integrated_data_access_with_status",
+        "status": "operational",
+        "cache_enabled": True,
+        "supported_data_types": list(data_access.file_mapping.keys()),
+        "supported_wind_farms": ["wf1", "wf2", "wf3", "wf4", "wf5", "wf6", "wf7"],
+        "data_source": f"{PROCESSED_DIR}/ parquet files",
+        "file_mapping": data_access.file_mapping,
+        "normalization": "automatic_wind_farm_id_conversion",
+        "model_performance_tracking": True
+    },
+    "feature_availability": query_router.feature_availability,
+    "notebook_completion_status": query_router.notebook_status,
+    "model_performance_summary": {
+        "available_models": list(query_router.model_performance["available"].keys()),
+        "pending_models": list(query_router.model_performance["unavailable"].keys()),
+        "best_24h_rmse": query_router.model_performance["available"].get("xgboost", {}).get("rmse_24h", "0.067"),
+        "best_model": "XGBoost"
+    },
+    "improvements_v2.1": [
+        "Added notebook completion status tracking",
+        "Implemented graceful fallback responses",
+        "Enhanced feature availability checking", 
+        "Added alternative recommendation system",
+        "Integrated model performance data",
+        "Improved user experience for incomplete features",
+        "Configuration-driven status management",
+        "Smart routing with development phase awareness"
+    ],
+    "supported_analyses": list(query_router.intent_patterns.keys()),
+    "notebook_coverage": {
+        "completed": [nb for nb, status in query_router.notebook_status.items() if status],
+        "pending": [nb for nb, status in query_router.notebook_status.items() if not status]
+    },
+    "prompt_files_loaded": list(query_router.prompts.keys()),
+    "configuration_source": str(CONFIG_PATH)
+}
+
 @mcp.tool()
 def server_status() -> Dict[str, Any]:
     """
@@ -1667,102 +1824,15 @@ def server_status() -> Dict[str, Any]:
     Returns:
         Dictionary containing server status and configuration
     """
-    return {
-        "server_name": "Wind Farm Analytics MCP Server",
-        "version": "2.1.0",
-        "approach": "Integrated Data Access + Smart Query Routing + Graceful Fallbacks",
-        "status": "operational",
-        "architecture": "self_contained_with_status_tracking",
-        "capabilities": [
-            "Automatic query intent detection",
-            "Smart prompt combination", 
-            "Entity extraction",
-            "Multi-intent handling",
-            "Business context integration",
-            "Domain-specific tool APIs",
-            "Integrated parquet data access",
-            "Real-time structured data serving",
-            "Intelligent caching system",
-            "Robust error handling",
-            "Feature availability checking",
-            "Graceful fallback responses",
-            "Status-aware routing",
-            "Alternative recommendation system"
-        ],
-        "development_phases": {
-            "phase_1": {
-                "status": "complete",
-                "notebooks": ["01-08"],
-                "capabilities": ["data_analysis", "individual_models", "basic_forecasting"]
-            },
-            "phase_2": {
-                "status": "pending",
-                "notebooks": ["09-10"],
-                "capabilities": ["ensemble_models", "uncertainty_quantification", "comprehensive_evaluation"]
-            },
-            "phase_3": {
-                "status": "pending", 
-                "notebooks": ["11-12"],
-                "capabilities": ["production_deployment", "business_presentation"]
-            }
-        },
-        "available_tools": [
-            "get_wind_farm_data",
-            "analyze_power_curves",
-            "discover_processed_data",
-            "evaluate_forecast_performance", 
-            "assess_temporal_patterns",
-            "quantify_uncertainty",
-            "calculate_business_impact",
-            "compare_model_architectures",
-            "analyze_feature_importance",
-            "diagnose_forecast_errors",
-            "analyze_pattern",
-            "summarize_wind_farm",
-            "compare_wind_farms",
-            "search_notebooks",
-            "list_available_wind_farms",
-            "extract_notebook_results",
-            "server_status"
-        ],
-        "data_access": {
-            "system": "integrated_data_access_with_status",
-            "status": "operational",
-            "cache_enabled": True,
-            "supported_data_types": list(data_access.file_mapping.keys()),
-            "supported_wind_farms": ["wf1", "wf2", "wf3", "wf4", "wf5", "wf6", "wf7"],
-            "data_source": "/workspaces/temus/data/processed/ parquet files",
-            "file_mapping": data_access.file_mapping,
-            "normalization": "automatic_wind_farm_id_conversion",
-            "model_performance_tracking": True
-        },
-        "feature_availability": query_router.feature_availability,
-        "notebook_completion_status": query_router.notebook_status,
-        "model_performance_summary": {
-            "available_models": list(query_router.model_performance["available"].keys()),
-            "pending_models": list(query_router.model_performance["unavailable"].keys()),
-            "best_24h_rmse": query_router.model_performance["available"].get("xgboost", {}).get("rmse_24h", "0.067"),
-            "best_model": "XGBoost"
-        },
-        "improvements_v2.1": [
-            "Added notebook completion status tracking",
-            "Implemented graceful fallback responses",
-            "Enhanced feature availability checking", 
-            "Added alternative recommendation system",
-            "Integrated model performance data",
-            "Improved user experience for incomplete features",
-            "Configuration-driven status management",
-            "Smart routing with development phase awareness"
-        ],
-        "supported_analyses": list(query_router.intent_patterns.keys()),
-        "notebook_coverage": {
-            "completed": [nb for nb, status in query_router.notebook_status.items() if status],
-            "pending": [nb for nb, status in query_router.notebook_status.items() if not status]
-        },
-        "prompt_files_loaded": list(query_router.prompts.keys()),
-        "configuration_source": str(Path(__file__).parent / "notebook_config.json"),
-        "timestamp": datetime.now().isoformat()
-    }
+    return {**_SERVER_STATUS_PAYLOAD, "timestamp": datetime.now().isoformat()}
+
+# Starting points suggested by discover_processed_data
+_RECOMMENDED_FILES = [
+    "02_wind_physics_analysis.parquet",
+    "power_curve_parameters.parquet", 
+    "summary_stats.parquet",
+    "07_ml_models_results.parquet"
+]
 
 @mcp.tool()
 def discover_processed_data() -> Dict[str, Any]:
@@ -1772,48 +1842,78 @@ def discover_processed_data() -> Dict[str, Any]:
     Returns:
         Dictionary containing information about available processed data files
     """
-    from pathlib import Path
-    import os
-    
     try:
-        processed_dir = Path("/workspaces/temus/data/processed")
+        processed_dir = PROCESSED_DIR
+        directory_exists = processed_dir.exists()
         files_info = {}
         
-        if processed_dir.exists():
-            for parquet_file in processed_dir.glob("*.parquet"):
-                try:
-                    stat = parquet_file.stat()
-                    files_info[parquet_file.name] = {
-                        "size_bytes": stat.st_size,
-                        "size_mb": round(stat.st_size / (1024 * 1024), 2),
-                        "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                        "path": str(parquet_file)
-                    }
-                except Exception as e:
-                    files_info[parquet_file.name] = {"error": str(e)}
+        if directory_exists:
+            # Single directory pass; entries already carry their name and path
+            with os.scandir(processed_dir) as entries:
+                for entry in entries:
+                    # Skip hidden files as glob('*.parquet') did, and directories
+                    if (not entry.name.endswith('.parquet') or entry.name.startswith('.')
+                            or not entry.is_file()):
+                        continue
+                    try:
+                        stat = entry.stat()
+                        files_info[entry.name] = {
+                            "size_bytes": stat.st_size,
+                            "size_mb": round(stat.st_size / (1024 * 1024), 2),
+                            "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                            "path": entry.path
+                        }
+                    except Exception as e:
+                        files_info[entry.name] = {"error": str(e)}
         
         return {
             "processed_files": files_info,
             "total_files": len(files_info),
             "data_directory": str(processed_dir),
-            "directory_exists": processed_dir.exists(),
-            "recommended_files": [
-                "02_wind_physics_analysis.parquet",
-                "power_curve_parameters.parquet", 
-                "summary_stats.parquet",
-                "07_ml_models_results.parquet"
-            ],
-            "status": "operational" if processed_dir.exists() else "error"
+            "directory_exists": directory_exists,
+            "recommended_files": _RECOMMENDED_FILES,
+            "status": "operational" if directory_exists else "error"
         }
         
     except Exception as e:
         return {
             "error": f"Failed to discover processed data: {str(e)}",
-            "data_directory": "/workspaces/temus/data/processed",
+            "data_directory": str(PROCESSED_DIR),
             "status": "error"
         }
 
 # Direct parquet reading functions for fallback
+
+# Classify a column name as one power curve metric in a single pass. The
+# lookaheads keep the original "both words appear anywhere" semantics and the
+# alternation order preserves the capacity > cut-in > rated speed > rated power
+# priority of the old if/elif chains.
+_METRIC_RE = re.compile(
+    r'(?P<cf>(?=.*capacity)(?=.*factor))'
+    r'|(?P<ci>(?=.*cut)(?=.*in))'
+    r'|(?P<rs>(?=.*rated)(?=.*speed))'
+    r'|(?P<rp>(?=.*rated)(?=.*power))',
+    re.IGNORECASE
+)
+_METRIC_KEYS = {
+    'cf': 'capacity_factor',
+    'ci': 'cut_in_speed',
+    'rs': 'rated_speed',
+    'rp': 'rated_power'
+}
+
+# Priority order of files to check for power curve data
+_POWER_CURVE_FILES = [
+    "power_curve_parameters.parquet",
+    "02_wind_physics_analysis.parquet", 
+    "baseline_power_curve_parameters.parquet",
+    "summary_stats.parquet",
+    "01_comprehensive_eda_results.parquet"
+]
+
+# Fallback results keyed by (wind farm, newest candidate file mtime)
+_power_curve_cache: Dict[tuple, Dict[str, Any]] = {}
+
 def _read_power_curve_from_parquet(wind_farm: str = None, include_metrics: list = None) -> Dict[str, Any]:
     """
     Direct parquet file reading for power curves as fallback method.
@@ -1825,9 +1925,24 @@ def _read_power_curve_from_parquet(wind_farm: str = None, include_metrics: list
     Returns:
         Dictionary containing power curve data
     """
-    from pathlib import Path
+    processed_dir = PROCESSED_DIR
     
-    logger.info(f"Fallback: Reading power curve data from parquet for {wind_farm}")
+    # Parquet files are static within a session, so reuse earlier results
+    # until one of the candidate files is rewritten
+    cache_key = None
+    try:
+        latest_mtime = max(
+            (path.stat().st_mtime for path in (processed_dir / f for f in _POWER_CURVE_FILES) if path.exists()),
+            default=0.0
+        )
+        cache_key = (wind_farm or "__all__", latest_mtime)
+        if cache_key in _power_curve_cache:
+            logger.info("Returning cached power curve data for %s", wind_farm)
+            return dict(_power_curve_cache[cache_key])
+    except OSError as e:
+        logger.warning("Could not check power curve file times: %s", e)
+    
+    logger.info("Fallback: Reading power curve data from parquet for %s", wind_farm)
     
     results = {
         'wind_farm': wind_farm,
@@ -1842,22 +1957,22 @@ def _read_power_curve_from_parquet(wind_farm: str = None, include_metrics: list
     }
     
     try:
-        processed_dir = Path("/workspaces/temus/data/processed")
-        
-        # Priority order of files to check for power curve data
-        candidate_files = [
-            "power_curve_parameters.parquet",
-            "02_wind_physics_analysis.parquet", 
-            "baseline_power_curve_parameters.parquet",
-            "summary_stats.parquet",
-            "01_comprehensive_eda_results.parquet"
-        ]
-        
-        for filename in candidate_files:
-            file_path = processed_dir / filename
-            if file_path.exists():
+        existing_files = [f for f in _POWER_CURVE_FILES if (processed_dir / f).exists()]
+        
+        # pyarrow releases the GIL while decoding, so read the next candidate
+        # while the current one is examined, in priority order. Two workers
+        # keep the remaining reads queued, so they are cancelled (never
+        # decoded) once a match is found
+        executor = ThreadPoolExecutor(max_workers=2)
+        try:
+            futures = [
+                (filename, executor.submit(_read_power_curve_columns, processed_dir / filename))
+                for filename in existing_files
+            ]
+            
+            for filename, future in futures:
                 try:
-                    df = pd.read_parquet(file_path)
+                    df = future.result()
                     results['source_files'].append(filename)
                     
                     # Try to extract wind farm specific data
@@ -1876,18 +1991,58 @@ def _read_power_curve_from_parquet(wind_farm: str = None, include_metrics: list
                 except Exception as e:
                     logger.warning(f"Could not read {filename}: {str(e)}")
                     continue
+        finally:
+            # Don't wait on lower-priority reads once a match is found
+            executor.shutdown(wait=False, cancel_futures=True)
         
         # If no specific data found, provide a summary
         if not results['source_files']:
             results['error'] = "No suitable power curve data files found"
-            results['available_files'] = [f.name for f in processed_dir.glob("*.parquet")]
+            with os.scandir(processed_dir) as entries:
+                results['available_files'] = [
+                    e.name for e in entries
+                    if e.name.endswith('.parquet') and not e.name.startswith('.') and e.is_file()
+                ]
         
     except Exception as e:
         logger.error(f"Error in fallback parquet reading: {str(e)}")
         results['error'] = str(e)
     
+    # Cache successful results
+    if cache_key is not None and results['error'] is None:
+        _power_curve_cache[cache_key] = dict(results)
+    
     return results
 
+def _read_power_curve_columns(file_path: Path) -> pd.DataFrame:
+    """Read only the wind farm and power curve metric columns of a parquet file."""
+    parquet_file = pq.ParquetFile(file_path)
+    # Project with the same classifier the extractors use so no unused
+    # column chunks are decompressed
+    columns = [
+        col for col in parquet_file.schema_arrow.names
+        if col == 'wind_farm' or _METRIC_RE.match(col)
+    ]
+    return parquet_file.read(columns=columns).to_pandas()
+
+def _first_row_by_farm(farms: pd.Series) -> Dict[str, int]:
+    """Map each lowercased wind farm name to the position of its first row."""
+    # Encode as categorical so only the distinct names are lowercased,
+    # rather than allocating a lowered copy of every row
+    categorical = pd.Categorical(farms)
+    codes, positions = np.unique(categorical.codes, return_index=True)
+    
+    first_rows = {}
+    for code, position in zip(codes, positions):
+        if code < 0:  # missing values
+            continue
+        name = categorical.categories[code]
+        if isinstance(name, str):
+            name = name.lower()
+            first_rows[name] = min(int(position), first_rows.get(name, int(position)))
+    
+    return first_rows
+
 def _extract_wind_farm_metrics(df: pd.DataFrame, wind_farm: str) -> Dict[str, Any]:
     """Extract metrics for a specific wind farm from dataframe."""
     metrics = {}
@@ -1905,51 +2060,33 @@ def _extract_wind_farm_metrics(df: pd.DataFrame, wind_farm: str) -> Dict[str, An
         # Try to find wind farm data
         farm_data = None
         if 'wind_farm' in df.columns:
+            first_rows = _first_row_by_farm(df['wind_farm'])
             for variant in farm_variants:
-                mask = df['wind_farm'].str.lower() == variant
-                if mask.any():
-                    farm_data = df[mask].iloc[0]
+                if variant in first_rows:
+                    farm_data = df.iloc[first_rows[variant]]
                     break
         
         if farm_data is not None:
-            # Extract capacity factor
-            cf_cols = [col for col in df.columns if 'capacity' in col.lower() and 'factor' in col.lower()]
-            if cf_cols:
-                metrics['capacity_factor'] = float(farm_data[cf_cols[0]]) if pd.notna(farm_data[cf_cols[0]]) else None
-            
-            # Extract cut-in speed
-            cutin_cols = [col for col in df.columns if 'cut' in col.lower() and 'in' in col.lower()]
-            if cutin_cols:
-                metrics['cut_in_speed'] = float(farm_data[cutin_cols[0]]) if pd.notna(farm_data[cutin_cols[0]]) else None
-            
-            # Extract rated speed
-            rated_cols = [col for col in df.columns if 'rated' in col.lower() and 'speed' in col.lower()]
-            if rated_cols:
-                metrics['rated_speed'] = float(farm_data[rated_cols[0]]) if pd.notna(farm_data[rated_cols[0]]) else None
-            
-            # Extract rated power
-            power_cols = [col for col in df.columns if 'rated' in col.lower() and 'power' in col.lower()]
-            if power_cols:
-                metrics['rated_power'] = float(farm_data[power_cols[0]]) if pd.notna(farm_data[power_cols[0]]) else None
+            # Take the first column matching each metric
+            values = farm_data[df.filter(regex=_METRIC_RE, axis=1).columns]
+            present = pd.notna(values)
+            for col in values.index:
+                key = _METRIC_KEYS[_METRIC_RE.match(col).lastgroup]
+                if key not in metrics:
+                    metrics[key] = float(values[col]) if present[col] else None
         
         # If no wind_farm column, try to extract from index or other methods
         elif len(df) <= 7:  # Likely one row per wind farm
             # Try to infer which row corresponds to our wind farm
             farm_idx = int(farm_id[-1]) - 1 if farm_id[-1].isdigit() else 0
             if 0 <= farm_idx < len(df):
-                row_data = df.iloc[farm_idx]
+                row_data = df.filter(regex=_METRIC_RE, axis=1).iloc[farm_idx]
+                present = pd.notna(row_data)
                 
                 # Extract available metrics
-                for col in df.columns:
-                    col_lower = col.lower()
-                    if 'capacity' in col_lower and 'factor' in col_lower:
-                        metrics['capacity_factor'] = float(row_data[col]) if pd.notna(row_data[col]) else None
-                    elif 'cut' in col_lower and 'in' in col_lower:
-                        metrics['cut_in_speed'] = float(row_data[col]) if pd.notna(row_data[col]) else None
-                    elif 'rated' in col_lower and 'speed' in col_lower:
-                        metrics['rated_speed'] = float(row_data[col]) if pd.notna(row_data[col]) else None
-                    elif 'rated' in col_lower and 'power' in col_lower:
-                        metrics['rated_power'] = float(row_data[col]) if pd.notna(row_data[col]) else None
+                for col in row_data.index:
+                    key = _METRIC_KEYS[_METRIC_RE.match(col).lastgroup]
+                    metrics[key] = float(row_data[col]) if present[col] else None
         
     except Exception as e:
         logger.error(f"Error extracting wind farm metrics: {str(e)}")
@@ -1963,17 +2100,17 @@ def _extract_general_metrics(df: pd.DataFrame) -> Dict[str, Any]:
     
     try:
         # Look for aggregate metrics across all wind farms
-        for col in df.columns:
-            col_lower = col.lower()
-            if 'capacity' in col_lower and 'factor' in col_lower:
-                if df[col].dtype in ['float64', 'int64'] and not df[col].isna().all():
-                    metrics['average_capacity_factor'] = float(df[col].mean())
-            elif 'cut' in col_lower and 'in' in col_lower:
-                if df[col].dtype in ['float64', 'int64'] and not df[col].isna().all():
-                    metrics['average_cut_in_speed'] = float(df[col].mean())
-            elif 'rated' in col_lower and 'speed' in col_lower:
-                if df[col].dtype in ['float64', 'int64'] and not df[col].isna().all():
-                    metrics['average_rated_speed'] = float(df[col].mean())
+        metric_df = df.filter(regex=_METRIC_RE, axis=1)
+        numeric_df = metric_df.loc[:, metric_df.dtypes.map(_is_numeric_column)]
+        
+        # Reduce the numeric block once rather than column by column
+        means = numeric_df.mean()
+        has_values = numeric_df.notna().any()
+        for col in numeric_df.columns:
+            group = _METRIC_RE.match(col).lastgroup
+            # Rated power is not averaged across farms
+            if group != 'rp' and has_values[col]:
+                metrics[f'average_{_METRIC_KEYS[group]}'] = float(means[col])
         
         # Count available wind farms
         if 'wind_farm' in df.columns:
@@ -4,58 +4,83 @@ Concatenate markdown sections into a single slides.md file.
 Supports both markdown sections and custom HTML slides.
 """
 
+import io
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import re
 
-def concat_sections():
-    """Combine all section files into slides.md."""
+SCRIPTS_DIR = Path(__file__).parent
+PRESENTATION_DIR = SCRIPTS_DIR.parent
+SECTIONS_DIR = PRESENTATION_DIR / "sections"
+OUTPUT_FILE = PRESENTATION_DIR / "slides.md"
+
+# Include directives look like <!-- include-html: file.html -->
+_INCLUDE_PREFIX = '<!-- include-html: '
+_INCLUDE_SUFFIX = ' -->'
+
+# Stripped section text keyed by path, as (mtime_ns, content); lets the
+# in-process watcher re-read only the sections that changed
+_section_cache = {}
+
+def read_section(section_file):
+    """Return the stripped text of a section, reusing it while its mtime is unchanged."""
     
-    presentation_dir = Path(__file__).parent.parent
-    sections_dir = presentation_dir / "sections"
-    output_file = presentation_dir / "slides.md"
+    mtime_ns = section_file.stat().st_mtime_ns
+    cached = _section_cache.get(section_file)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
     
-    # Get all section files in order
-    section_files = []
+    content = section_file.read_text(encoding='utf-8').strip()
+    _section_cache[section_file] = (mtime_ns, content)
+    return content
+
+def concat_sections():
+    """Combine all section files into slides.md."""
     
-    # First, get numbered markdown sections
-    for file in sorted(sections_dir.glob("*.md")):
-        if file.name[0].isdigit():
-            section_files.append(file)
+    # Get all numbered markdown sections in order
+    with os.scandir(SECTIONS_DIR) as entries:
+        section_files = [
+            Path(entry.path)
+            for entry in sorted(entries, key=lambda e: e.name)
+            if entry.name.endswith(".md") and entry.name[:1].isdigit() and entry.is_file()
+        ]
     
     print(f"Found {len(section_files)} section files to process")
     
-    # Build the combined content
-    combined_content = []
-    combined_content.append("<!-- AUTO-GENERATED FILE - DO NOT EDIT DIRECTLY -->")
-    combined_content.append("<!-- Edit files in sections/ directory instead -->")
-    combined_content.append("")
+    # Build the combined content in a single buffer
+    buf = io.StringIO()
+    buf.write("<!-- AUTO-GENERATED FILE - DO NOT EDIT DIRECTLY -->\n")
+    buf.write("<!-- Edit files in sections/ directory instead -->\n")
+    buf.write("\n")
+    
+    # Read sections concurrently so slow disks overlap their waits;
+    # map() keeps the results in section order
+    if len(section_files) > 2:
+        with ThreadPoolExecutor(max_workers=min(16, len(section_files))) as executor:
+            contents = list(executor.map(read_section, section_files))
+    else:
+        contents = [read_section(section_file) for section_file in section_files]
     
-    for i, section_file in enumerate(section_files):
+    for i, (section_file, content) in enumerate(zip(section_files, contents)):
         print(f"Processing {section_file.name}")
         
-        # Read section content
-        with open(section_file, 'r', encoding='utf-8') as f:
-            content = f.read().strip()
-        
         # Add section separator (except for first section)
         if i > 0:
-            combined_content.append("\n---\n")
+            buf.write("\n\n---\n\n")
         
         # Check for custom HTML include directive
         if "<!-- include-html:" in content:
             # Process custom HTML includes
-            content = process_html_includes(content, sections_dir)
+            content = process_html_includes(content, SECTIONS_DIR)
         
-        combined_content.append(f"<!-- Section: {section_file.name} -->")
-        combined_content.append(content)
+        buf.write(f"<!-- Section: {section_file.name} -->\n")
+        buf.write(content)
     
     # Write combined file
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(combined_content))
+    OUTPUT_FILE.write_text(buf.getvalue(), encoding='utf-8')
     
     print(f"✓ Combined {len(section_files)} sections into slides.md")
-    print(f"✓ Output file: {output_file}")
+    print(f"✓ Output file: {OUTPUT_FILE}")
     
     # Also create a file watcher version for VS Code task
     create_file_watcher()
@@ -63,11 +88,17 @@ def concat_sections():
 def process_html_includes(content, sections_dir):
     """Replace HTML include directives with actual content."""
     
-    # Pattern to find include directives
-    pattern = r'<!-- include-html: (.*?) -->'
+    # Rendered replacement per file name, so a repeated include is only
+    # checked and read once
+    replacements = {}
+    
+    def replace_include(html_file):
+        if html_file in replacements:
+            return replacements[html_file]
+        replacements[html_file] = replacement = render_include(html_file)
+        return replacement
     
-    def replace_include(match):
-        html_file = match.group(1)
+    def render_include(html_file):
         html_path = sections_dir / "custom" / html_file
         
         if html_path.exists():
@@ -79,14 +110,47 @@ def process_html_includes(content, sections_dir):
         else:
             return f'<!-- ERROR: {html_file} not found -->'
     
-    return re.sub(pattern, replace_include, content)
+    # Scan by index in a single linear pass: no copies of the remaining
+    # text per directive, and closing markers are only looked for up to
+    # the end of the directive's line
+    buf = io.StringIO()
+    pos = 0
+    line_end = -1
+    while True:
+        start = content.find(_INCLUDE_PREFIX, pos)
+        if start == -1:
+            buf.write(content[pos:])
+            break
+        
+        # Reuse the line end while directives stay on the same line, so a
+        # line with many directives is only scanned for its newline once
+        name_start = start + len(_INCLUDE_PREFIX)
+        if name_start > line_end:
+            line_end = content.find('\n', name_start)
+            if line_end == -1:
+                line_end = len(content)
+        end = content.find(_INCLUDE_SUFFIX, name_start, line_end)
+        if end == -1:
+            # No closing marker on this line, so no directive starting on
+            # it can complete either; keep the line as text
+            buf.write(content[pos:line_end])
+            pos = line_end
+            continue
+        
+        buf.write(content[pos:start])
+        buf.write(replace_include(content[name_start:end]))
+        pos = end + len(_INCLUDE_SUFFIX)
+    
+    return buf.getvalue()
 
 def create_file_watcher():
     """Create a simple file watcher for VS Code task."""
     
     watcher_content = """#!/usr/bin/env python3
 import time
-import subprocess
+import threading
+import traceback
+import importlib.util
 from pathlib import Path
 
 try:
@@ -99,11 +163,45 @@ except ImportError:
     print("Install with: pip install watchdog")
 
 if WATCHDOG_AVAILABLE:
+    # Load concat-sections.py once and rebuild in-process instead of
+    # starting a new interpreter per change
+    _spec = importlib.util.spec_from_file_location(
+        "concat_sections", Path(__file__).parent / "concat-sections.py")
+    _concat = importlib.util.module_from_spec(_spec)
+    _spec.loader.exec_module(_concat)
+
     class SectionHandler(FileSystemEventHandler):
+        # Editors emit bursts of events per save; rebuild once they settle
+        DEBOUNCE_SECONDS = 0.25
+
+        def __init__(self):
+            super().__init__()
+            self._lock = threading.Lock()
+            # Held for the whole rebuild, so a timer firing while a slow
+            # rebuild runs waits for it instead of writing alongside it
+            self._build_lock = threading.Lock()
+            self._timer = None
+
         def on_modified(self, event):
             if event.src_path.endswith('.md') or event.src_path.endswith('.html'):
                 print(f"Change detected: {event.src_path}")
-                subprocess.run([Path(__file__).parent / "concat-sections.py"])
+                with self._lock:
+                    if self._timer is not None:
+                        self._timer.cancel()
+                    self._timer = threading.Timer(self.DEBOUNCE_SECONDS, self._flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+
+        def _flush(self):
+            with self._lock:
+                self._timer = None
+            with self._build_lock:
+                try:
+                    _concat.concat_sections()
+                except (OSError, ValueError):
+                    # Unreadable or undecodable section; keep watching, the
+                    # next save gets another try
+                    traceback.print_exc()
 
     if __name__ == "__main__":
         observer = Observer()
@@ -120,7 +218,7 @@ else:
     print("File watcher not available. Run concat-sections.py manually after changes.")
 """
     
-    watcher_path = Path(__file__).parent / "watch-sections.py"
+    watcher_path = SCRIPTS_DIR / "watch-sections.py"
     with open(watcher_path, 'w') as f:
         f.write(watcher_content)
     os.chmod(watcher_path, 0o755)
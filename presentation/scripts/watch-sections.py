@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 import time
-import subprocess
+import threading
+import traceback
+import importlib.util
 from pathlib import Path
 
 try:
@@ -13,11 +15,45 @@ except ImportError:
     print("Install with: pip install watchdog")
 
 if WATCHDOG_AVAILABLE:
+    # Load concat-sections.py once and rebuild in-process instead of
+    # starting a new interpreter per change
+    _spec = importlib.util.spec_from_file_location(
+        "concat_sections", Path(__file__).parent / "concat-sections.py")
+    _concat = importlib.util.module_from_spec(_spec)
+    _spec.loader.exec_module(_concat)
+
     class SectionHandler(FileSystemEventHandler):
+        # Editors emit bursts of events per save; rebuild once they settle
+        DEBOUNCE_SECONDS = 0.25
+
+        def __init__(self):
+            super().__init__()
+            self._lock = threading.Lock()
+            # Held for the whole rebuild, so a timer firing while a slow
+            # rebuild runs waits for it instead of writing alongside it
+            self._build_lock = threading.Lock()
+            self._timer = None
+
         def on_modified(self, event):
             if event.src_path.endswith('.md') or event.src_path.endswith('.html'):
                 print(f"Change detected: {event.src_path}")
-                subprocess.run([Path(__file__).parent / "concat-sections.py"])
+                with self._lock:
+                    if self._timer is not None:
+                        self._timer.cancel()
+                    self._timer = threading.Timer(self.DEBOUNCE_SECONDS, self._flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+
+        def _flush(self):
+            with self._lock:
+                self._timer = None
+            with self._build_lock:
+                try:
+                    _concat.concat_sections()
+                except (OSError, ValueError):
+                    # Unreadable or undecodable section; keep watching, the
+                    # next save gets another try
+                    traceback.print_exc()
 
     if __name__ == "__main__":
         observer = Observer()
@@ -4,21 +4,132 @@ Utility functions for the Temus Wind Forecasting project.
 
 import pandas as pd
 import numpy as np
+import atexit
+import io
 import os
+import pickle
+import struct
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Union, Dict, Any
+from typing import TYPE_CHECKING, Optional, Union, Dict, Any, List
 import logging
 
+if TYPE_CHECKING:
+    import pyarrow
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Project root (assumes this file is in src/) and standard paths, built once
+_PROJECT_ROOT = Path(__file__).parent.parent
+_PATHS = {
+    'root': _PROJECT_ROOT,
+    'data_raw': _PROJECT_ROOT / 'data' / 'raw',
+    'data_processed': _PROJECT_ROOT / 'data' / 'processed',
+    'data_intermediate': _PROJECT_ROOT / 'data' / 'intermediate',
+    'outputs': _PROJECT_ROOT / 'outputs',
+    'figures': _PROJECT_ROOT / 'notebooks' / 'outputs' / 'figures',
+    'results': _PROJECT_ROOT / 'outputs' / 'results',
+    'models': _PROJECT_ROOT / 'models',
+    'notebooks': _PROJECT_ROOT / 'notebooks',
+    'src': _PROJECT_ROOT / 'src'
+}
+
+# Project-wide parquet codec; set TEMUS_PARQUET_CODEC (e.g. 'snappy') to compare
+DEFAULT_PARQUET_COMPRESSION = os.environ.get('TEMUS_PARQUET_CODEC', 'zstd')
+
+# Set TEMUS_FAST_SAVE=1 to skip per-save confirmation logging (and its stat call)
+_FAST_SAVE = os.environ.get('TEMUS_FAST_SAVE') == '1'
+
+# Codecs that accept a compression_level
+_LEVELLED_CODECS = {'zstd', 'gzip', 'brotli', 'lz4'}
+
+# Whether pyarrow imports, checked lazily by ensure_pyarrow()
+_PYARROW_OK: Optional[bool] = None
+
+# load_from_parquet arguments that pyarrow.parquet.read_table understands
+_READ_TABLE_ARGS = {'filters', 'use_threads'}
+
+# Background writer for save_to_parquet_async, created on first use
+_WRITE_POOL: Optional[ThreadPoolExecutor] = None
+
+# Directories already created (or found) this session
+_KNOWN_DIRS: set = set()
+
+# Results rows are tiny: compression, dictionaries, statistics and the page
+# index cost more in encoding time and footer bytes than they save
+_RESULTS_WRITE_OPTIONS = {
+    'compression': None,
+    'use_dictionary': False,
+    'write_statistics': False,
+    'write_page_index': False
+}
+
+# Rows queued by append_analysis_results() and not yet written by
+# flush_analysis_results(), per target file, and the files written this
+# session (later flushes append to them)
+_RESULTS_BATCHES: Dict[Path, List[Dict[str, Any]]] = {}
+_RESULTS_WRITTEN: set = set()
+_RESULTS_FLUSH_REGISTERED = False
+
+# Alignment of the pickle stream and out-of-band buffers in
+# save_dataframe_p5() files (cache line / AVX-512 width)
+_BUFFER_ALIGNMENT = 64
+
+# DataFrames longer than this are converted and written one row group at a
+# time, bounding peak memory to a row group's worth of Arrow buffers
+_STREAM_WRITE_MIN_ROWS = 500_000
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create a directory (and parents) unless it was already ensured this session."""
+    if path not in _KNOWN_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _KNOWN_DIRS.add(path)
+
+
+def _temp_path(filepath: Path) -> Path:
+    """Sibling temp file for writing ``filepath`` atomically, unique per process and thread."""
+    return filepath.with_name(f"{filepath.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+def _write_dataframe_streaming(df: pd.DataFrame, filepath: Path,
+                               preserve_index: Optional[bool],
+                               write_params: Dict[str, Any]) -> None:
+    """Write a large DataFrame row group by row group with a ParquetWriter."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    write_params = dict(write_params)
+    row_group_size = write_params.pop('row_group_size')
+    
+    # Infer the schema from the whole frame so object columns that are
+    # empty in the first chunk still get their real type
+    schema = pa.Schema.from_pandas(df, preserve_index=preserve_index)
+    with pq.ParquetWriter(filepath, schema, **write_params) as writer:
+        for start in range(0, len(df), row_group_size):
+            chunk = df.iloc[start:start + row_group_size]
+            writer.write_table(
+                pa.Table.from_pandas(chunk, schema=schema, preserve_index=preserve_index),
+                row_group_size=row_group_size
+            )
+
 
 def save_to_parquet(
-    df: pd.DataFrame,
+    df: Union[pd.DataFrame, 'pyarrow.Table'],
     filepath: Union[str, Path],
     create_dirs: bool = True,
-    compression: str = 'snappy',
+    compression: Optional[str] = DEFAULT_PARQUET_COMPRESSION,
+    compression_level: Optional[int] = 3,
+    row_group_size: int = 100_000,
+    use_dictionary: bool = True,
+    write_statistics: bool = True,
+    write_page_index: bool = True,
+    data_page_size: int = 1 << 20,
+    order_columns_by_size: bool = False,
+    fsync: bool = False,
     **kwargs
 ) -> bool:
     """
@@ -26,16 +137,45 @@ def save_to_parquet(
     
     Parameters:
     -----------
-    df : pd.DataFrame
-        DataFrame to save
+    df : pd.DataFrame or pyarrow.Table
+        DataFrame to save (an Arrow table is written as-is)
     filepath : str or Path
         Path to save the parquet file
     create_dirs : bool, default=True
         Whether to create parent directories if they don't exist
-    compression : str, default='snappy'
-        Compression algorithm to use
+    compression : str or None, default='zstd'
+        Compression algorithm to use (overridable via TEMUS_PARQUET_CODEC);
+        None writes uncompressed pages, fastest when disk I/O is not the
+        bottleneck (RAM disk, local NVMe)
+    compression_level : int, optional, default=3
+        Compression level, ignored for codecs without levels (e.g. snappy)
+    row_group_size : int, default=100_000
+        Maximum number of rows per row group; smaller groups let filtered
+        and column-projected reads skip more data
+    use_dictionary : bool, default=True
+        Dictionary-encode columns (compact for repeated farm ids, timestamps)
+    write_statistics : bool, default=True
+        Write column min/max statistics so readers can skip row groups
+    write_page_index : bool, default=True
+        Write the page index so readers can skip individual pages
+    data_page_size : int, default=1 MiB
+        Target size of data pages within a column chunk
+    order_columns_by_size : bool, default=False
+        Store columns from smallest to largest in memory, so column chunks of
+        narrow columns sit next to each other and projected reads of them
+        need fewer, larger I/Os. Changes the column order seen by readers
+    fsync : bool, default=False
+        Flush the file to disk before it replaces the target. Files are
+        always written to a temporary name and renamed into place, so a
+        crash never leaves a torn file; fsync adds durability on power loss
     **kwargs
-        Additional arguments passed to pd.DataFrame.to_parquet()
+        Additional arguments passed to pyarrow.parquet.write_table(), e.g.
+        coerce_timestamps='ms' with allow_truncated_timestamps=True
+        (``index`` is honoured as in pd.DataFrame.to_parquet()). Passing
+        another ``engine`` (e.g. 'fastparquet') writes with
+        pd.DataFrame.to_parquet() instead, with only ``compression``,
+        ``index`` and these arguments; the pyarrow tuning options above
+        are then ignored
     
     Returns:
     --------
@@ -49,38 +189,136 @@ def save_to_parquet(
     True
     """
     try:
+        engine = kwargs.pop('engine', 'pyarrow')
+        if engine == 'pyarrow':
+            _require_pyarrow()
         filepath = Path(filepath)
         
         # Create directories if needed
         if create_dirs:
-            filepath.parent.mkdir(parents=True, exist_ok=True)
+            _ensure_dir(filepath.parent)
         
         # Default parameters for consistent saving
         default_params = {
             'index': False,
             'compression': compression,
-            'engine': 'pyarrow'
+            'engine': engine,
+            'row_group_size': row_group_size,
+            'use_dictionary': use_dictionary,
+            'write_statistics': write_statistics,
+            'write_page_index': write_page_index,
+            'data_page_size': data_page_size
         }
+        if (compression_level is not None and isinstance(compression, str)
+                and compression.lower() in _LEVELLED_CODECS):
+            default_params['compression_level'] = compression_level
         
         # Update with any user-provided parameters
         default_params.update(kwargs)
         
         # Save the DataFrame
-        df.to_parquet(filepath, **default_params)
+        if 'partition_cols' in default_params:
+            df.to_parquet(filepath, **default_params)
+        else:
+            default_params.pop('engine')
+            preserve_index = default_params.pop('index')
+            if isinstance(df, pd.DataFrame) and order_columns_by_size and df.columns.is_unique:
+                sizes = df.memory_usage(index=False, deep=True)
+                df = df[sorted(df.columns, key=sizes.__getitem__)]
+            
+            # Write under a temporary name and rename into place, so readers
+            # never see a partially written file
+            tmp_path = _temp_path(filepath)
+            try:
+                if engine != 'pyarrow':
+                    # Other engines only understand pd.DataFrame.to_parquet()
+                    # options, not the pyarrow write_table tuning above
+                    other_params = {k: v for k, v in kwargs.items() if k != 'index'}
+                    df.to_parquet(tmp_path, engine=engine, compression=compression,
+                                  index=preserve_index, **other_params)
+                elif not isinstance(df, pd.DataFrame):
+                    import pyarrow.parquet as pq
+                    pq.write_table(df, tmp_path, **default_params)
+                elif len(df) > _STREAM_WRITE_MIN_ROWS:
+                    _write_dataframe_streaming(df, tmp_path, preserve_index, default_params)
+                else:
+                    import pyarrow as pa
+                    import pyarrow.parquet as pq
+                    table = pa.Table.from_pandas(df, preserve_index=preserve_index)
+                    pq.write_table(table, tmp_path, **default_params)
+                
+                if fsync:
+                    with open(tmp_path, 'rb+') as f:
+                        os.fsync(f.fileno())
+                os.replace(tmp_path, filepath)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
         
         # Log success with file size
-        file_size = filepath.stat().st_size
-        logger.info(f"Saved {len(df):,} rows to {filepath} ({file_size:,} bytes)")
+        if not _FAST_SAVE and logger.isEnabledFor(logging.INFO):
+            file_size = filepath.stat().st_size
+            logger.info("Saved %d rows to %s (%d bytes)", len(df), filepath, file_size)
         
         return True
         
     except Exception as e:
-        logger.error(f"Failed to save DataFrame to {filepath}: {e}")
+        logger.error("Failed to save DataFrame to %s: %s", filepath, e)
         return False
 
 
+def _get_write_pool() -> ThreadPoolExecutor:
+    """Create the background write pool on first use; pending writes finish at exit."""
+    global _WRITE_POOL
+    if _WRITE_POOL is None:
+        _WRITE_POOL = ThreadPoolExecutor(
+            max_workers=max(1, (os.cpu_count() or 2) // 2),
+            thread_name_prefix='parquet-writer'
+        )
+        atexit.register(_WRITE_POOL.shutdown, wait=True)
+    return _WRITE_POOL
+
+
+def save_to_parquet_async(
+    df: Union[pd.DataFrame, 'pyarrow.Table'],
+    filepath: Union[str, Path],
+    **kwargs
+) -> Future:
+    """
+    Save DataFrame to parquet on a background thread.
+    
+    Lets a notebook overlap several writes with each other and with further
+    computation. Do not modify ``df`` until the returned future is done.
+    
+    Parameters:
+    -----------
+    df : pd.DataFrame or pyarrow.Table
+        DataFrame to save
+    filepath : str or Path
+        Path to save the parquet file
+    **kwargs
+        Additional arguments passed to save_to_parquet()
+    
+    Returns:
+    --------
+    concurrent.futures.Future
+        Resolves to save_to_parquet()'s result (True if successful)
+    
+    Examples:
+    ---------
+    >>> futures = [save_to_parquet_async(df, f'data/processed/part_{i}.parquet')
+    ...            for i, df in enumerate(frames)]
+    >>> all(f.result() for f in futures)
+    True
+    """
+    return _get_write_pool().submit(save_to_parquet, df, filepath, **kwargs)
+
+
 def load_from_parquet(
     filepath: Union[str, Path],
+    columns: Optional[List[str]] = None,
+    arrow_dtypes: bool = False,
+    mmap: bool = True,
     **kwargs
 ) -> Optional[pd.DataFrame]:
     """
@@ -90,8 +328,18 @@ def load_from_parquet(
     -----------
     filepath : str or Path
         Path to the parquet file
+    columns : list of str, optional
+        Only read these columns (all columns if None); the stored index,
+        e.g. a timestamp DatetimeIndex, is always kept
+    arrow_dtypes : bool, default=False
+        Return Arrow-backed pandas dtypes (pd.ArrowDtype) instead of NumPy
+        dtypes; avoids converting the column data
+    mmap : bool, default=True
+        Memory-map the file so the page cache serves it without an extra
+        read buffer; turn off for network filesystems
     **kwargs
-        Additional arguments passed to pd.read_parquet()
+        Additional arguments passed to pd.read_parquet(); ``filters`` and
+        ``use_threads`` are served by a memory-mapped pyarrow read
     
     Returns:
     --------
@@ -103,35 +351,85 @@ def load_from_parquet(
     >>> df = load_from_parquet('data/processed/sample.parquet')
     >>> print(df.shape)
     (3, 2)
+    >>> load_from_parquet('data/processed/sample.parquet', columns=['A']).shape
+    (3, 1)
     """
     try:
         filepath = Path(filepath)
         
         if not filepath.exists():
-            logger.error(f"File does not exist: {filepath}")
+            logger.error("File does not exist: %s", filepath)
             return None
         
         # Default parameters
         default_params = {
-            'engine': 'pyarrow'
+            'engine': 'pyarrow',
+            'columns': columns
         }
+        if arrow_dtypes:
+            default_params['dtype_backend'] = 'pyarrow'
         
         # Update with user parameters
         default_params.update(kwargs)
         
         # Load the DataFrame
-        df = pd.read_parquet(filepath, **default_params)
+        if default_params['engine'] == 'pyarrow':
+            _require_pyarrow()
+        if default_params['engine'] == 'pyarrow' and _READ_TABLE_ARGS.issuperset(kwargs):
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            
+            # Map the file rather than copying it, and release Arrow buffers
+            # column by column while converting to cut peak memory
+            table = pq.read_table(filepath, columns=columns, memory_map=mmap,
+                                  use_pandas_metadata=True, **kwargs)
+            df = table.to_pandas(
+                self_destruct=True,
+                split_blocks=True,
+                use_threads=True,
+                types_mapper=pd.ArrowDtype if arrow_dtypes else None
+            )
+            del table
+
+            # Report how much of the file a projected read skipped; the
+            # total comes from the footer (or dataset schema for a
+            # directory) and an unreadable footer never fails the load
+            if columns is not None and logger.isEnabledFor(logging.INFO):
+                try:
+                    if filepath.is_dir():
+                        n_total = len(pq.ParquetDataset(filepath).schema.names)
+                    else:
+                        n_total = len(pq.read_schema(filepath, memory_map=mmap).names)
+                    logger.info("Projected %d/%d columns from %s", len(columns), n_total, filepath)
+                except (OSError, pa.ArrowInvalid) as e:
+                    logger.debug("Could not count columns in %s: %s", filepath, e)
+        else:
+            df = pd.read_parquet(filepath, **default_params)
         
         # Log success
-        logger.info(f"Loaded {len(df):,} rows from {filepath}")
+        logger.info("Loaded %d rows from %s", len(df), filepath)
         
         return df
         
     except Exception as e:
-        logger.error(f"Failed to load DataFrame from {filepath}: {e}")
+        logger.error("Failed to load DataFrame from %s: %s", filepath, e)
         return None
 
 
+def _results_to_table(results: Dict[str, Any]):
+    """Build a single-row Arrow table straight from a results dict."""
+    import pyarrow as pa
+    
+    arrays = []
+    for value in results.values():
+        if isinstance(value, pd.Timestamp) and value.tz is None:
+            # Keep the Timestamp's own resolution, as the DataFrame path does
+            arrays.append(pa.array([value], type=pa.timestamp(value.unit)))
+        else:
+            arrays.append(pa.array([value]))
+    return pa.Table.from_arrays(arrays, names=[str(key) for key in results])
+
+
 def save_results_dict(
     results: Dict[str, Any],
     filepath: Union[str, Path],
@@ -162,17 +460,163 @@ def save_results_dict(
     True
     """
     try:
-        # Convert dict to single-row DataFrame
-        results_df = pd.DataFrame([results])
+        # Build the single-row table directly; fall back to a DataFrame for
+        # values Arrow cannot convert on its own
+        results_data = None
+        if results:
+            try:
+                results_data = _results_to_table(results)
+            except (ImportError, TypeError, ValueError):
+                # pyarrow's ArrowInvalid/ArrowTypeError subclass these
+                pass
+        if results_data is None:
+            results_data = pd.DataFrame([results])
         
         # Use the main save function
-        return save_to_parquet(results_df, filepath, create_dirs=create_dirs)
+        return save_to_parquet(results_data, filepath, create_dirs=create_dirs,
+                               **_RESULTS_WRITE_OPTIONS)
+        
+    except Exception as e:
+        logger.error("Failed to save results dict: %s", e)
+        return False
+
+
+def _align(n: int) -> int:
+    """Round ``n`` up to the next multiple of _BUFFER_ALIGNMENT."""
+    return -(-n // _BUFFER_ALIGNMENT) * _BUFFER_ALIGNMENT
+
+
+def save_dataframe_p5(
+    df: pd.DataFrame,
+    filepath: Union[str, Path],
+    create_dirs: bool = True
+) -> bool:
+    """
+    Save a DataFrame with pickle protocol 5 and out-of-band buffers.
+    
+    A fast hand-off between Python pipeline steps: column arrays are written
+    as raw buffers instead of being encoded, and load_dataframe_p5() maps
+    them back without re-parsing. Parquet remains the format for anything
+    read by other tools.
+    
+    The file holds a length-prefixed header listing the pickle size and
+    each buffer's offset and size, then the pickle stream, then the buffers.
+    The pickle stream and every buffer start on a 64-byte boundary so the
+    loaded column arrays are aligned.
+    
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        DataFrame to save
+    filepath : str or Path
+        Path to save the file (conventionally ``.pkl``)
+    create_dirs : bool, default=True
+        Whether to create parent directories if they don't exist
+    
+    Returns:
+    --------
+    bool
+        True if successful, False otherwise
+    
+    Examples:
+    ---------
+    >>> save_dataframe_p5(df, 'data/intermediate/features.pkl')
+    True
+    """
+    try:
+        filepath = Path(filepath)
+        if create_dirs:
+            _ensure_dir(filepath.parent)
+        
+        buffers = []
+        payload = pickle.dumps(df, protocol=5, buffer_callback=buffers.append)
+        raw_buffers = [buffer.raw() for buffer in buffers]
+        
+        # Buffer offsets are relative to the (aligned) end of the header
+        layout = []
+        offset = _align(len(payload))
+        for raw in raw_buffers:
+            layout.append((offset, raw.nbytes))
+            offset = _align(offset + raw.nbytes)
+        header = pickle.dumps((len(payload), layout))
+        data_start = _align(8 + len(header))
+        
+        tmp_path = _temp_path(filepath)
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(struct.pack('<Q', len(header)))
+                f.write(header)
+                f.write(bytes(data_start - 8 - len(header)))
+                f.write(payload)
+                position = len(payload)
+                for (buffer_offset, size), raw in zip(layout, raw_buffers):
+                    f.write(bytes(buffer_offset - position))
+                    f.write(raw)
+                    position = buffer_offset + size
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        
+        logger.info("Saved %d rows to %s (pickle protocol 5)", len(df), filepath)
+        return True
         
     except Exception as e:
-        logger.error(f"Failed to save results dict: {e}")
+        logger.error("Failed to save DataFrame to %s: %s", filepath, e)
         return False
 
 
+def load_dataframe_p5(filepath: Union[str, Path]) -> Optional[pd.DataFrame]:
+    """
+    Load a DataFrame written by save_dataframe_p5().
+    
+    The file is read with a single readinto() into a 64-byte aligned buffer
+    and the column arrays are rebuilt as aligned views of it, so no further
+    copies are made. Only load files you trust: this unpickles arbitrary
+    objects.
+    
+    Parameters:
+    -----------
+    filepath : str or Path
+        Path to the file
+    
+    Returns:
+    --------
+    pd.DataFrame or None
+        Loaded DataFrame, or None if loading failed
+    """
+    try:
+        filepath = Path(filepath)
+        
+        if not filepath.exists():
+            logger.error("File does not exist: %s", filepath)
+            return None
+        
+        # Over-allocate and start reading at the first aligned address, so
+        # the aligned file offsets are aligned in memory too
+        size = filepath.stat().st_size
+        block = np.empty(size + _BUFFER_ALIGNMENT, dtype=np.uint8)
+        shift = -block.ctypes.data % _BUFFER_ALIGNMENT
+        view = memoryview(block[shift:shift + size])
+        with open(filepath, 'rb') as f:
+            f.readinto(view)
+        
+        (header_size,) = struct.unpack_from('<Q', view)
+        payload_size, layout = pickle.loads(view[8:8 + header_size])
+        data = view[_align(8 + header_size):]
+        payload = data[:payload_size]
+        buffers = [data[offset:offset + size] for offset, size in layout]
+        
+        df = pickle.loads(payload, buffers=buffers)
+        
+        logger.info("Loaded %d rows from %s", len(df), filepath)
+        return df
+        
+    except Exception as e:
+        logger.error("Failed to load DataFrame from %s: %s", filepath, e)
+        return None
+
+
 def get_project_paths() -> Dict[str, Path]:
     """
     Get standard project paths for consistent file organization.
@@ -180,47 +624,57 @@ def get_project_paths() -> Dict[str, Path]:
     Returns:
     --------
     dict
-        Dictionary of project paths
-    """
-    # Get project root (assumes this file is in src/)
-    project_root = Path(__file__).parent.parent
-    
-    paths = {
-        'root': project_root,
-        'data_raw': project_root / 'data' / 'raw',
-        'data_processed': project_root / 'data' / 'processed',
-        'data_intermediate': project_root / 'data' / 'intermediate',
-        'outputs': project_root / 'outputs',
-        'figures': project_root / 'notebooks' / 'outputs' / 'figures',
-        'results': project_root / 'outputs' / 'results',
-        'models': project_root / 'models',
-        'notebooks': project_root / 'notebooks',
-        'src': project_root / 'src'
-    }
-    
-    return paths
+        Dictionary of project paths (a fresh copy, safe to modify)
+    """
+    return dict(_PATHS)
 
 
-def ensure_pyarrow():
+def ensure_pyarrow() -> bool:
     """
-    Ensure pyarrow is available for parquet operations.
+    Check whether pyarrow is available for parquet operations.
+    
+    The result is cached, so repeated checks are free. pyarrow is listed in
+    requirements.txt; this never installs packages itself.
+    
+    Returns:
+    --------
+    bool
+        True if pyarrow can be imported, False otherwise
     """
-    try:
-        import pyarrow
-        logger.info(f"PyArrow {pyarrow.__version__} is available")
-        return True
-    except ImportError:
-        logger.warning("PyArrow not found. Installing...")
+    global _PYARROW_OK
+    if _PYARROW_OK is None:
         try:
-            import subprocess
-            import sys
-            subprocess.check_call([sys.executable, "-m", "pip", "install", "pyarrow"])
             import pyarrow
-            logger.info(f"PyArrow {pyarrow.__version__} installed successfully")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to install PyArrow: {e}")
-            return False
+            logger.debug("PyArrow %s is available", pyarrow.__version__)
+            _PYARROW_OK = True
+        except ImportError:
+            _PYARROW_OK = False
+    return _PYARROW_OK
+
+
+def _require_pyarrow():
+    """Raise an instructive ImportError if pyarrow is missing."""
+    if not ensure_pyarrow():
+        raise ImportError("pyarrow is required for parquet I/O; install it with `pip install pyarrow`")
+
+
+def _savefig_atomic(fig, filepath: Path, **kwargs) -> None:
+    """
+    Render a figure in memory and move it into place in one step.
+    
+    Readers (e.g. another notebook reloading figures) never see a partially
+    written file, and the image is written with a single call.
+    """
+    buf = io.BytesIO()
+    fig.savefig(buf, **kwargs)
+    
+    tmp_path = _temp_path(filepath)
+    try:
+        tmp_path.write_bytes(buf.getbuffer())
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def save_figure(
@@ -269,17 +723,14 @@ def save_figure(
     True
     """
     try:
-        # Get project paths
-        paths = get_project_paths()
-        
         # Create save directory - always use notebooks/outputs/figures
         if subdir:
-            save_dir = paths['figures'] / subdir
+            save_dir = _PATHS['figures'] / subdir
         else:
-            save_dir = paths['figures']
+            save_dir = _PATHS['figures']
             
         if create_dirs:
-            save_dir.mkdir(parents=True, exist_ok=True)
+            _ensure_dir(save_dir)
         
         # Construct full filepath
         if not filename.endswith(f'.{format}'):
@@ -287,7 +738,8 @@ def save_figure(
         filepath = save_dir / filename
         
         # Save the figure
-        fig.savefig(
+        _savefig_atomic(
+            fig,
             filepath, 
             dpi=dpi, 
             bbox_inches=bbox_inches, 
@@ -295,16 +747,56 @@ def save_figure(
             **kwargs
         )
         
-        logger.info(f"Figure saved: {filepath}")
+        if not _FAST_SAVE:
+            logger.info("Figure saved: %s", filepath)
         return True
         
     except Exception as e:
-        logger.error(f"Failed to save figure {filename}: {e}")
+        logger.error("Failed to save figure %s: %s", filename, e)
         return False
 
 
+def configure_plotting(**overrides) -> Dict[str, Any]:
+    """
+    Apply the project's figure defaults to matplotlib's rcParams.
+    
+    Opt-in and done once per session: styling that would otherwise be set
+    figure by figure (size, grid, bold titles, tight layout) comes from
+    rcParams for every subsequent figure.
+    
+    Parameters:
+    -----------
+    **overrides
+        rcParams entries that replace or extend the project defaults
+    
+    Returns:
+    --------
+    dict
+        The rcParams values that were applied
+    
+    Examples:
+    ---------
+    >>> configure_plotting()
+    >>> configure_plotting(**{'figure.figsize': (16, 10)})
+    """
+    import matplotlib.pyplot as plt
+    
+    settings = {
+        'figure.figsize': (12, 8),
+        'axes.grid': True,
+        'grid.alpha': 0.3,
+        'axes.titlesize': 14,
+        'axes.titleweight': 'bold',
+        'figure.autolayout': True
+    }
+    settings.update(overrides)
+    plt.rcParams.update(settings)
+    return settings
+
+
 def create_and_save_figure(filename=None, figsize=(12, 8), dpi=300, 
-                                   format='png', save_to_outputs=True, show_figure=True):
+                                   format='png', save_to_outputs=True, show_figure=True,
+                                   bbox_inches='tight'):
     """
     Enhanced decorator that addresses scope issues and provides more flexibility.
     
@@ -328,6 +820,9 @@ def create_and_save_figure(filename=None, figsize=(12, 8), dpi=300,
         Whether to save figure to outputs directory
     show_figure : bool, default=True
         Whether to display figure in notebook
+    bbox_inches : str or None, default='tight'
+        Bounding box when saving; None skips the extra layout pass that
+        'tight' needs (use 'jpeg'/'webp' at a lower dpi for quick thumbnails)
         
     Returns:
     --------
@@ -349,12 +844,12 @@ def create_and_save_figure(filename=None, figsize=(12, 8), dpi=300,
         return create_complex_plot(data, parameters, ax)
     """
     def decorator(func):
+        # Determine filename and save location once per decorated function
+        save_filename = filename or func.__name__.replace('plot_', '').replace('_', '_')
+        save_path = _PATHS['figures'] / f"{save_filename}.{format}"
+        
         def wrapper(*args, **kwargs):
             import matplotlib.pyplot as plt
-            from pathlib import Path
-            
-            # Determine filename
-            save_filename = filename or func.__name__.replace('plot_', '').replace('_', '_')
             
             # Extract data parameter if provided (fix for DataFrame ambiguous truth value)
             data = kwargs.get('data')
@@ -380,16 +875,13 @@ def create_and_save_figure(filename=None, figsize=(12, 8), dpi=300,
                 
                 # Save figure if requested
                 if save_to_outputs and save_filename:
-                    # Get project paths and ensure figures directory exists
-                    paths = get_project_paths()
-                    figures_dir = paths['figures']
-                    figures_dir.mkdir(parents=True, exist_ok=True)
+                    # Ensure figures directory exists
+                    _ensure_dir(save_path.parent)
                     
                     # Save with specified format and DPI
-                    save_path = figures_dir / f"{save_filename}.{format}"
-                    fig.savefig(save_path, dpi=dpi, bbox_inches='tight', 
-                               facecolor='white', edgecolor='none')
-                    logger.info(f"Figure saved: {save_path}")
+                    _savefig_atomic(fig, save_path, dpi=dpi, bbox_inches=bbox_inches, 
+                                    format=format, facecolor='white', edgecolor='none')
+                    logger.info("Figure saved: %s", save_path)
                 
                 # Display figure if requested
                 if show_figure:
@@ -399,7 +891,7 @@ def create_and_save_figure(filename=None, figsize=(12, 8), dpi=300,
                 return result
                 
             except Exception as e:
-                logger.error(f"Error in plotting function {func.__name__}: {e}")
+                logger.error("Error in plotting function %s: %s", func.__name__, e)
                 # Show empty plot with error message
                 ax.text(0.5, 0.5, f'Error: {str(e)}', ha='center', va='center', 
                        transform=ax.transAxes, fontsize=12, color='red')
@@ -423,7 +915,7 @@ def ensure_figures_directory() -> Path:
     """
     paths = get_project_paths()
     figures_dir = paths['figures']  # Now points to notebooks/outputs/figures
-    figures_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(figures_dir)
     return figures_dir
 
 
@@ -432,8 +924,9 @@ def save_processed_data(
     filename: str,
     subdir: str = '',
     create_dirs: bool = True,
+    async_write: bool = False,
     **kwargs
-) -> bool:
+) -> Union[bool, Future]:
     """
     Save DataFrame to the data/processed directory with consistent settings.
     
@@ -450,13 +943,17 @@ def save_processed_data(
         Optional subdirectory within data/processed
     create_dirs : bool, default=True
         Whether to create directories if they don't exist
+    async_write : bool, default=False
+        Write on a background thread and return a Future instead of waiting
     **kwargs
-        Additional arguments passed to save_to_parquet()
+        Additional arguments passed to save_to_parquet() (zstd level 3 by
+        default; compression=None for uncompressed output)
     
     Returns:
     --------
-    bool
-        True if successful, False otherwise
+    bool or concurrent.futures.Future
+        True if successful, False otherwise (a Future resolving to that
+        result when async_write=True)
     
     Examples:
     ---------
@@ -482,27 +979,51 @@ def save_processed_data(
         
         # Create directory if needed
         if create_dirs:
-            save_dir.mkdir(parents=True, exist_ok=True)
+            _ensure_dir(save_dir)
         
         # Construct full filepath
         filepath = save_dir / filename
         
-        # Ensure we're using absolute path
-        filepath = filepath.resolve()
+        # Ensure we're using absolute path (lexically; no filesystem lookups)
+        filepath = Path(os.path.abspath(filepath))
         
         # Save the DataFrame
+        if async_write:
+            return save_to_parquet_async(df, filepath, create_dirs=False, **kwargs)
         success = save_to_parquet(df, filepath, create_dirs=False, **kwargs)
         
         if success:
-            logger.info(f"Processed data saved: {filepath}")
+            logger.info("Processed data saved: %s", filepath)
         
         return success
         
     except Exception as e:
-        logger.error(f"Failed to save processed data {filename}: {e}")
+        logger.error("Failed to save processed data %s: %s", filename, e)
         return False
 
 
+def _analysis_results_path(filename: str, notebook_name: Optional[str],
+                           to_data_dir: bool) -> Path:
+    """Build the absolute parquet path used for a set of analysis results."""
+    # Create filename with notebook prefix if provided
+    if notebook_name:
+        if not filename.startswith(notebook_name):
+            filename = f"{notebook_name}_{filename}"
+    
+    # Ensure .parquet extension
+    if not filename.endswith('.parquet'):
+        filename = f"{filename}.parquet"
+    
+    # Choose directory based on parameter
+    if to_data_dir:
+        filepath = _PATHS['data_processed'] / filename
+    else:
+        filepath = _PATHS['outputs'] / filename
+    
+    # Ensure absolute path (lexically; no filesystem lookups)
+    return Path(os.path.abspath(filepath))
+
+
 def save_analysis_results(
     results: Dict[str, Any],
     filename: str,
@@ -538,40 +1059,156 @@ def save_analysis_results(
     True
     """
     try:
-        # Get project paths
-        paths = get_project_paths()
-        
-        # Create filename with notebook prefix if provided
-        if notebook_name:
-            if not filename.startswith(notebook_name):
-                filename = f"{notebook_name}_{filename}"
-        
-        # Ensure .parquet extension
-        if not filename.endswith('.parquet'):
-            filename = f"{filename}.parquet"
-        
-        # Choose directory based on parameter
-        if to_data_dir:
-            filepath = paths['data_processed'] / filename
-        else:
-            filepath = paths['outputs'] / filename
-        
-        # Ensure absolute path
-        filepath = filepath.resolve()
+        filepath = _analysis_results_path(filename, notebook_name, to_data_dir)
         
         # Save results
         success = save_results_dict(results, filepath, **kwargs)
         
         if success:
-            logger.info(f"Analysis results saved: {filepath}")
+            logger.info("Analysis results saved: %s", filepath)
         
         return success
         
     except Exception as e:
-        logger.error(f"Failed to save analysis results {filename}: {e}")
+        logger.error("Failed to save analysis results %s: %s", filename, e)
         return False
 
 
+def append_analysis_results(
+    results: Dict[str, Any],
+    filename: str,
+    notebook_name: str = None,
+    to_data_dir: bool = True
+) -> Path:
+    """
+    Queue one row of analysis results for a shared multi-row parquet file.
+    
+    For sweeps that log many small result sets (per fold, per epoch, ...):
+    rows for the same file are collected in memory and written together as
+    one table by flush_analysis_results(), which also runs at interpreter
+    exit. The file naming matches save_analysis_results(). Queued rows that
+    fail to write can be dropped with discard_analysis_results().
+    
+    Parameters:
+    -----------
+    results : dict
+        Dictionary of analysis results (one row)
+    filename : str
+        Base filename (without extension)
+    notebook_name : str, optional
+        Name of the notebook for prefixing (e.g., '01_data_foundation')
+    to_data_dir : bool, default=True
+        If True, save to data/processed; if False, save to outputs
+    
+    Returns:
+    --------
+    Path
+        Path of the file the row will be written to
+    
+    Examples:
+    ---------
+    >>> for fold, score in enumerate(scores):
+    ...     append_analysis_results({'fold': fold, 'rmse': score}, 'cv_scores', '07_ml_models')
+    >>> flush_analysis_results()
+    True
+    """
+    global _RESULTS_FLUSH_REGISTERED
+    filepath = _analysis_results_path(filename, notebook_name, to_data_dir)
+    _RESULTS_BATCHES.setdefault(filepath, []).append(dict(results))
+    
+    if not _RESULTS_FLUSH_REGISTERED:
+        atexit.register(flush_analysis_results)
+        _RESULTS_FLUSH_REGISTERED = True
+    
+    return filepath
+
+
+def flush_analysis_results() -> bool:
+    """
+    Write every results file with rows queued by append_analysis_results().
+    
+    Queued rows are released once their file is written. A file already
+    written this session is read back and rewritten with the new rows
+    appended, so it always holds every row logged for it this session, as a
+    single row group.
+    
+    If a file fails to write (e.g. a column holds numbers in some rows and
+    strings in others), its rows stay queued and are retried by the next
+    flush. Drop them with discard_analysis_results() and append corrected
+    rows to recover.
+    
+    Returns:
+    --------
+    bool
+        True if all pending files were written, False otherwise
+    """
+    success = True
+    for filepath in sorted(_RESULTS_BATCHES):
+        rows = _RESULTS_BATCHES[filepath]
+        if filepath in _RESULTS_WRITTEN and filepath.exists():
+            # Append to the rows written by earlier flushes
+            try:
+                import pyarrow.parquet as pq
+                rows = pq.read_table(filepath).to_pylist() + rows
+            except Exception as e:
+                logger.error("Failed to read results file %s: %s", filepath, e)
+                success = False
+                continue
+        
+        try:
+            import pyarrow as pa
+            # Union of keys in first-seen order; rows lacking a key get null
+            columns = dict.fromkeys(key for row in rows for key in row)
+            results_data = pa.Table.from_pydict(
+                {str(key): [row.get(key) for row in rows] for key in columns}
+            )
+        except (ImportError, TypeError, ValueError):
+            results_data = pd.DataFrame(rows)
+        
+        if save_to_parquet(results_data, filepath, **_RESULTS_WRITE_OPTIONS):
+            del _RESULTS_BATCHES[filepath]
+            _RESULTS_WRITTEN.add(filepath)
+        else:
+            success = False
+    
+    return success
+
+
+def discard_analysis_results(
+    filename: str = None,
+    notebook_name: str = None,
+    to_data_dir: bool = True
+) -> int:
+    """
+    Drop rows queued by append_analysis_results() without writing them.
+    
+    Use this to recover when flush_analysis_results() keeps failing on a
+    file; rows already written to disk are not affected.
+    
+    Parameters:
+    -----------
+    filename : str, optional
+        Base filename as passed to append_analysis_results(); if None, the
+        queued rows for every file are dropped
+    notebook_name : str, optional
+        Name of the notebook used for prefixing
+    to_data_dir : bool, default=True
+        Whether the rows were queued for data/processed or outputs
+    
+    Returns:
+    --------
+    int
+        Number of rows dropped
+    """
+    if filename is None:
+        dropped = sum(len(rows) for rows in _RESULTS_BATCHES.values())
+        _RESULTS_BATCHES.clear()
+        return dropped
+    
+    filepath = _analysis_results_path(filename, notebook_name, to_data_dir)
+    return len(_RESULTS_BATCHES.pop(filepath, []))
+
+
 def ensure_data_directories() -> Dict[str, Path]:
     """
     Ensure all standard data directories exist and return their absolute paths.
@@ -597,13 +1234,13 @@ def ensure_data_directories() -> Dict[str, Path]:
         
         # Create all directories
         for name, path in directories.items():
-            path.mkdir(parents=True, exist_ok=True)
-            logger.debug(f"Ensured directory exists: {path}")
+            _ensure_dir(path)
+            logger.debug("Ensured directory exists: %s", path)
         
         return directories
         
     except Exception as e:
-        logger.error(f"Failed to create data directories: {e}")
+        logger.error("Failed to create data directories: %s", e)
         return {}
 
 
@@ -612,8 +1249,9 @@ def save_intermediate_data(
     filename: str,
     subdir: str = '',
     create_dirs: bool = True,
+    async_write: bool = False,
     **kwargs
-) -> bool:
+) -> Union[bool, Future]:
     """
     Save DataFrame to the data/intermediate directory for intermediate processing steps.
     
@@ -630,13 +1268,17 @@ def save_intermediate_data(
         Optional subdirectory within data/intermediate
     create_dirs : bool, default=True
         Whether to create directories if they don't exist
+    async_write : bool, default=False
+        Write on a background thread and return a Future instead of waiting
     **kwargs
-        Additional arguments passed to save_to_parquet()
+        Additional arguments passed to save_to_parquet() (zstd level 3 by
+        default; compression=None for uncompressed output)
     
     Returns:
     --------
-    bool
-        True if successful, False otherwise
+    bool or concurrent.futures.Future
+        True if successful, False otherwise (a Future resolving to that
+        result when async_write=True)
     
     Examples:
     ---------
@@ -662,24 +1304,26 @@ def save_intermediate_data(
         
         # Create directory if needed
         if create_dirs:
-            save_dir.mkdir(parents=True, exist_ok=True)
+            _ensure_dir(save_dir)
         
         # Construct full filepath
         filepath = save_dir / filename
         
-        # Ensure we're using absolute path
-        filepath = filepath.resolve()
+        # Ensure we're using absolute path (lexically; no filesystem lookups)
+        filepath = Path(os.path.abspath(filepath))
         
         # Save the DataFrame
+        if async_write:
+            return save_to_parquet_async(df, filepath, create_dirs=False, **kwargs)
         success = save_to_parquet(df, filepath, create_dirs=False, **kwargs)
         
         if success:
-            logger.info(f"Intermediate data saved: {filepath}")
+            logger.info("Intermediate data saved: %s", filepath)
         
         return success
         
     except Exception as e:
-        logger.error(f"Failed to save intermediate data {filename}: {e}")
+        logger.error("Failed to save intermediate data %s: %s", filename, e)
         return False
 
 
@@ -747,8 +1391,11 @@ class AnalysisVisualizer:
         
         # Use self.data - no scope issues
         if hasattr(self.data, 'columns') and 'POWER' in self.data.columns:
-            power_data = self.data['POWER'].dropna()
-            ax.hist(power_data, bins=50, alpha=0.7, edgecolor='black')
+            power_data = self.data['POWER'].to_numpy(dtype=float, na_value=np.nan)
+            power_data = power_data[~np.isnan(power_data)]
+            counts, edges = np.histogram(power_data, bins=50)
+            ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+                   alpha=0.7, edgecolor='black')
             ax.set_xlabel('Power Generation (MW)')
             ax.set_ylabel('Frequency')
             ax.set_title('Power Generation Distribution')
@@ -776,6 +1423,3 @@ class AnalysisVisualizer:
         """Update visualization configuration"""
         self.config.update(kwargs)
 
-
-# Initialize pyarrow on import
-ensure_pyarrow()